@@ -19,11 +19,13 @@ import os
 import re
 import sys
 from collections import OrderedDict, namedtuple
+from distutils.errors import DistutilsOptionError
 from itertools import chain, groupby
 
-import semver
 from setuptools import Command
 
+from .version import InvalidVersion, bump_version, normalize_channel
+
 
 try:
     from textwrap import indent
@@ -126,6 +128,9 @@ class ChangeLog(Command):
          ' where %s is a placeholder for issue number.'),
         ('next-version', None,
          'Prints next release version to stdout.'),
+        ('pre=', None,
+         'Makes next release version a pre-release of the specified channel:'
+         ' dev, a, b or rc.'),
         ('use-towncrier', None,
          'Reuses fragments made for towncrier.'),
         ('update=', None,
@@ -144,6 +149,7 @@ class ChangeLog(Command):
     minor_changes_types = None
     patch_changes_types = None
     next_version = False
+    pre = None
     update = None
     use_towncrier = False
 
@@ -183,6 +189,12 @@ class ChangeLog(Command):
         self.all_changes_types.update(self.minor_changes_types)
         self.all_changes_types.update(self.patch_changes_types)
 
+        if self.pre is not None:
+            try:
+                self.pre = normalize_channel(self.pre)
+            except ValueError as err:
+                raise DistutilsOptionError('--pre: {}'.format(err))
+
     def _parse_changes_types(self, changes_types, default):
         if isinstance(changes_types, dict):
             return changes_types
@@ -258,31 +270,22 @@ class ChangeLog(Command):
         ))
 
         orig_version = self.distribution.get_version()
-        match = re.match(
-            r'^(?P<major>(?:0|[1-9][0-9]*))'
-            r'\.(?P<minor>(?:0|[1-9][0-9]*))'
-            r'(?:\.(?P<patch>(?:0|[1-9][0-9]*)))?',
-            orig_version,
-            re.VERBOSE,
-        )
-        if match is None:
-            raise RuntimeError('Version {} could not be used for SemVer'
-                               ''.format(orig_version))
-        groups = match.groupdict()
-        qual_version = '.'.join([
-            groups['major'], groups['minor'], groups['patch'] or '0'
-        ])
-
-        next_version = None
+        version_part = None
         for chtype, _ in group_by_type(fragments, changes_types):
             if chtype in self.major_changes_types:
-                next_version = semver.bump_major(qual_version)
+                version_part = 'major'
             elif chtype in self.minor_changes_types:
-                next_version = semver.bump_minor(qual_version)
+                version_part = 'minor'
             elif chtype in self.patch_changes_types:
-                next_version = semver.bump_patch(qual_version)
+                version_part = 'patch'
             break
-        assert next_version is not None
+        assert version_part is not None
+
+        try:
+            next_version = bump_version(orig_version, version_part, self.pre)
+        except InvalidVersion as err:
+            self.warn(str(err))
+            sys.exit(1)
 
         if self.next_version:
             print(next_version)
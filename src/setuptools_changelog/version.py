@@ -0,0 +1,260 @@
+#
+# Copyright 2018, Alexander Shorin
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import re
+from collections import namedtuple
+
+
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    from functools import wraps
+
+    # Simplified replacement for Python 3 lru_cache: the cache is dropped
+    # entirely once it's full instead of evicting least recently used items.
+    def lru_cache(maxsize=128):
+        def decorator(func):
+            cache = {}
+            kwd_mark = object()
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = args
+                if kwargs:
+                    key += (kwd_mark,) + tuple(sorted(kwargs.items()))
+                try:
+                    return cache[key]
+                except KeyError:
+                    if len(cache) >= maxsize:
+                        cache.clear()
+                    result = cache[key] = func(*args, **kwargs)
+                    return result
+
+            wrapper.cache_clear = cache.clear
+            return wrapper
+
+        return decorator
+
+
+VERSION_CACHE_SIZE = 1024
+VERSION_PARTS = ('major', 'minor', 'patch')
+PRE_RELEASE_CHANNELS = ('dev', 'a', 'b', 'rc')
+PRE_RELEASE_ALIASES = {
+    'alpha': 'a',
+    'beta': 'b',
+    'c': 'rc',
+    'pre': 'rc',
+    'preview': 'rc',
+}
+SEMVER_CHANNEL_NAMES = {
+    'a': 'alpha',
+    'b': 'beta',
+}
+PEP440 = 'pep440'
+SEMVER = 'semver'
+
+# Accepts both PEP-440 (1.4.0rc3, 1.4.0.dev12+abc) and SemVer (1.4.0-rc.3)
+# notations. Extra release segments, post-release part and the commits
+# distance appended by `git describe` (1.4.0rc1.5+gabcdef) are tolerated, but
+# ignored, since they have no meaning for SemVer. Dash separated pre-release
+# part marks SemVer notation which is preserved on rendering.
+VERSION_RE = re.compile(
+    r'''
+    \A\s*v?
+    (?P<major>0|[1-9][0-9]*)
+    \.(?P<minor>0|[1-9][0-9]*)
+    (?:\.(?P<patch>0|[1-9][0-9]*))?
+    (?:\.[0-9]+)*
+    (?:
+        (?P<pre_sep>[-_.]?)
+        (?P<pre_channel>alpha|beta|preview|pre|rc|a|b|c)
+        [-_.]?
+        (?P<pre_number>[0-9]+)?
+        (?:\.[0-9]+)*
+    )?
+    (?:[-_.]?post[-_.]?[0-9]*)?
+    (?P<dev>
+        (?P<dev_sep>[-_.]?)
+        dev
+        [-_.]?
+        (?P<dev_number>[0-9]+)?
+        (?:\.[0-9]+)*
+    )?
+    (?:\+(?P<build>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+    \s*\Z
+    ''',
+    re.VERBOSE | re.IGNORECASE,
+)
+
+
+class InvalidVersion(RuntimeError):
+    def __init__(self, version, msg=None):
+        if msg is None:
+            msg = 'Version {} could not be used for SemVer'.format(version)
+        super(InvalidVersion, self).__init__(msg)
+
+
+class Version(namedtuple('Version', ['major', 'minor', 'patch',
+                                     'pre', 'dev', 'build', 'notation'])):
+    __slots__ = ()
+
+    def __new__(cls, major, minor, patch, pre=None, dev=None, build=None,
+                notation=PEP440):
+        return super(Version, cls).__new__(
+            cls, major, minor, patch, pre, dev, build, notation,
+        )
+
+    @property
+    def release(self):
+        return self.major, self.minor, self.patch
+
+    @property
+    def is_prerelease(self):
+        return self.pre is not None or self.dev is not None
+
+    @property
+    def sort_key(self):
+        # PEP-440 ordering: X.devN < X.aN < X.bN < X.rcN < X
+        if self.pre is not None:
+            pre = (PRE_RELEASE_CHANNELS.index(self.pre[0]), self.pre[1])
+        elif self.dev is not None:
+            pre = (-1, 0)
+        else:
+            pre = (len(PRE_RELEASE_CHANNELS), 0)
+        dev = float('inf') if self.dev is None else self.dev
+        return self.release, pre, dev
+
+    def __str__(self):
+        version = '{0.major}.{0.minor}.{0.patch}'.format(self)
+        if self.notation == SEMVER:
+            if self.pre is not None:
+                channel, number = self.pre
+                channel = SEMVER_CHANNEL_NAMES.get(channel, channel)
+                version += '-{}.{}'.format(channel, number)
+            if self.dev is not None:
+                version += '.dev.' if self.pre is not None else '-dev.'
+                version += str(self.dev)
+        else:
+            if self.pre is not None:
+                version += '{}{}'.format(*self.pre)
+            if self.dev is not None:
+                version += '.dev{}'.format(self.dev)
+        if self.build is not None:
+            version += '+{}'.format(self.build)
+        return version
+
+
+def normalize_channel(channel):
+    normalized = channel.strip().lower()
+    normalized = PRE_RELEASE_ALIASES.get(normalized, normalized)
+    if normalized not in PRE_RELEASE_CHANNELS:
+        raise ValueError(
+            'Unknown pre-release channel {!r}. Expected one of: {}'
+            ''.format(channel, ', '.join(PRE_RELEASE_CHANNELS))
+        )
+    return normalized
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def parse_version(version):
+    match = VERSION_RE.match(version)
+    if match is None:
+        raise InvalidVersion(version)
+    groups = match.groupdict()
+
+    pre = None
+    if groups['pre_channel'] is not None:
+        pre = (normalize_channel(groups['pre_channel']),
+               int(groups['pre_number'] or 0))
+
+    dev = None
+    if groups['dev'] is not None:
+        dev = int(groups['dev_number'] or 0)
+
+    if pre is not None:
+        notation = SEMVER if groups['pre_sep'] == '-' else PEP440
+    elif dev is not None:
+        notation = SEMVER if groups['dev_sep'] == '-' else PEP440
+    else:
+        notation = PEP440
+
+    return Version(
+        int(groups['major']),
+        int(groups['minor']),
+        int(groups['patch'] or 0),
+        pre,
+        dev,
+        groups['build'],
+        notation,
+    )
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def bump_version(version, part, pre=None):
+    if part not in VERSION_PARTS:
+        raise ValueError('Unknown version part {!r}. Expected one of: {}'
+                         ''.format(part, ', '.join(VERSION_PARTS)))
+
+    current = parse_version(version)
+    major, minor, patch = current.release
+
+    # Pre-release of X.Y.Z already stands for upcoming X.Y.Z release, so it
+    # only needs to be finalized unless bump requires higher version part.
+    if part == 'major':
+        if not (current.is_prerelease and minor == 0 and patch == 0):
+            major, minor, patch = major + 1, 0, 0
+    elif part == 'minor':
+        if not (current.is_prerelease and patch == 0):
+            minor, patch = minor + 1, 0
+    elif not current.is_prerelease:
+        patch += 1
+
+    if pre is None:
+        return str(Version(major, minor, patch))
+
+    channel = normalize_channel(pre)
+    same_release = (major, minor, patch) == current.release
+    if channel == 'dev':
+        if same_release and current.dev is not None:
+            candidate = current._replace(dev=current.dev + 1, build=None)
+        elif same_release and current.pre is not None:
+            # Development release of already published pre-release is
+            # the one for the next pre-release of the same channel.
+            pre_release = (current.pre[0], current.pre[1] + 1)
+            candidate = Version(major, minor, patch, pre_release, 1,
+                                notation=current.notation)
+        else:
+            candidate = Version(major, minor, patch, dev=1,
+                                notation=current.notation)
+    elif same_release and current.pre is not None \
+            and current.pre[0] == channel:
+        number = current.pre[1]
+        if current.dev is None:
+            number += 1
+        candidate = Version(major, minor, patch, (channel, number),
+                            notation=current.notation)
+    else:
+        candidate = Version(major, minor, patch, (channel, 1),
+                            notation=current.notation)
+
+    if candidate.sort_key <= current.sort_key:
+        raise InvalidVersion(
+            version,
+            'Version {} could not be bumped to {} pre-release: next version'
+            ' {} is not greater than the current one'
+            ''.format(version, channel, candidate),
+        )
+    return str(candidate)
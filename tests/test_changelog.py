@@ -15,6 +15,8 @@
 #
 
 
+from distutils.errors import DistutilsOptionError
+
 import pytest
 
 
@@ -115,3 +117,56 @@ def test_next_patch_version(make_changelog, patch_changes, capsys):
     changelog.run()
     stdout, _ = capsys.readouterr()
     assert stdout == '0.0.1\n'
+
+
+def test_next_pre_release_version(make_changelog, minor_changes, capsys):
+    changelog = make_changelog(
+        changelog_fragments_path=minor_changes,
+        next_version=True,
+        pre='rc',
+    )
+    changelog.run()
+    stdout, _ = capsys.readouterr()
+    assert stdout == '0.1.0rc1\n'
+
+
+def test_finalize_pre_release_version(make_changelog, distribution,
+                                      patch_changes, capsys):
+    distribution.metadata.version = '1.4.0rc3'
+    changelog = make_changelog(
+        changelog_fragments_path=patch_changes,
+        next_version=True
+    )
+    changelog.run()
+    stdout, _ = capsys.readouterr()
+    assert stdout == '1.4.0\n'
+
+
+def test_next_dev_release_of_pre_release(make_changelog, distribution,
+                                         patch_changes, capsys):
+    distribution.metadata.version = '1.4.0rc3'
+    changelog = make_changelog(
+        changelog_fragments_path=patch_changes,
+        next_version=True,
+        pre='dev',
+    )
+    changelog.run()
+    stdout, _ = capsys.readouterr()
+    assert stdout == '1.4.0rc4.dev1\n'
+
+
+def test_next_lower_pre_release_channel(make_changelog, distribution,
+                                        patch_changes):
+    distribution.metadata.version = '1.4.0rc3'
+    changelog = make_changelog(
+        changelog_fragments_path=patch_changes,
+        next_version=True,
+        pre='a',
+    )
+    with pytest.raises(SystemExit):
+        changelog.run()
+
+
+def test_unknown_pre_release_channel(make_changelog):
+    with pytest.raises(DistutilsOptionError):
+        make_changelog(pre='gamma')
@@ -0,0 +1,124 @@
+#
+# Copyright 2018, Alexander Shorin
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from setuptools_changelog.version import (
+    SEMVER,
+    InvalidVersion,
+    Version,
+    bump_version,
+    parse_version,
+)
+
+
+@pytest.mark.parametrize(('version', 'expected'), [
+    ('1.2', Version(1, 2, 0)),
+    ('1.2.3', Version(1, 2, 3)),
+    ('1.2.3.4+gabcdef', Version(1, 2, 3, build='gabcdef')),
+    ('1.4.0rc3', Version(1, 4, 0, ('rc', 3))),
+    ('1.4.0-rc.3', Version(1, 4, 0, ('rc', 3), notation=SEMVER)),
+    ('1.4.0-beta', Version(1, 4, 0, ('b', 0), notation=SEMVER)),
+    ('1.4.0-dev.5', Version(1, 4, 0, dev=5, notation=SEMVER)),
+    ('1.4.0.dev12+abc', Version(1, 4, 0, dev=12, build='abc')),
+    ('1.4.0a1.dev2', Version(1, 4, 0, ('a', 1), 2)),
+    ('1.4.0.post1', Version(1, 4, 0)),
+    ('1.4.0rc1.5+gabc', Version(1, 4, 0, ('rc', 1), build='gabc')),
+    ('1.4.0-rc.1.5+gabc',
+     Version(1, 4, 0, ('rc', 1), build='gabc', notation=SEMVER)),
+    ('1.4.0.dev3.5+gabc', Version(1, 4, 0, dev=3, build='gabc')),
+])
+def test_parse_version(version, expected):
+    assert parse_version(version) == expected
+
+
+@pytest.mark.parametrize('version', ['', '1', 'abcdef', '1.2.3foo'])
+def test_parse_invalid_version(version):
+    with pytest.raises(InvalidVersion):
+        parse_version(version)
+
+
+def test_parse_version_is_cached():
+    assert parse_version('1.4.0rc3') is parse_version('1.4.0rc3')
+
+
+@pytest.mark.parametrize('version', [
+    '1.4.0rc3', '1.4.0a1.dev2', '1.4.0.dev12+abc',
+    '1.4.0-rc.3', '1.4.0-alpha.1.dev.2', '1.4.0-dev.12+abc',
+])
+def test_version_str(version):
+    assert str(parse_version(version)) == version
+
+
+@pytest.mark.parametrize(('version', 'part', 'expected'), [
+    ('1.2.3', 'major', '2.0.0'),
+    ('1.2.3', 'minor', '1.3.0'),
+    ('1.2.3', 'patch', '1.2.4'),
+    ('1.2.3+abc', 'patch', '1.2.4'),
+    ('1.4.0rc3', 'major', '2.0.0'),
+    ('1.4.0rc3', 'minor', '1.4.0'),
+    ('1.4.0rc3', 'patch', '1.4.0'),
+    ('2.0.0.dev12+abc', 'major', '2.0.0'),
+    ('1.4.1b2', 'minor', '1.5.0'),
+    ('1.4.0rc1.5+gabc', 'patch', '1.4.0'),
+])
+def test_bump_version(version, part, expected):
+    assert bump_version(version, part) == expected
+
+
+@pytest.mark.parametrize(('version', 'part', 'pre', 'expected'), [
+    ('1.3.2', 'patch', 'rc', '1.3.3rc1'),
+    ('1.3.2', 'minor', 'alpha', '1.4.0a1'),
+    ('1.4.0rc3', 'patch', 'rc', '1.4.0rc4'),
+    ('1.4.0rc3', 'major', 'rc', '2.0.0rc1'),
+    ('1.4.0b2', 'patch', 'rc', '1.4.0rc1'),
+    ('1.4.0rc1.dev2', 'patch', 'rc', '1.4.0rc1'),
+    ('1.4.0.dev12+abc', 'patch', 'dev', '1.4.0.dev13'),
+    ('1.4.0.dev12+abc', 'patch', 'a', '1.4.0a1'),
+    ('1.3.2', 'patch', 'dev', '1.3.3.dev1'),
+    ('1.4.0-rc.3', 'patch', 'rc', '1.4.0-rc.4'),
+    ('1.4.0rc1.5+gabc', 'patch', 'rc', '1.4.0rc2'),
+    ('1.4.0-rc.1.5+gabc', 'patch', 'rc', '1.4.0-rc.2'),
+    ('1.4.0-beta.2', 'patch', 'rc', '1.4.0-rc.1'),
+    ('1.4.0-rc.3', 'patch', 'dev', '1.4.0-rc.4.dev.1'),
+    ('1.4.0-dev.12', 'patch', 'dev', '1.4.0-dev.13'),
+    ('1.4.0-rc.3', 'major', 'beta', '2.0.0-beta.1'),
+    ('1.4.0rc3', 'patch', 'dev', '1.4.0rc4.dev1'),
+    ('1.4.0rc4.dev1', 'patch', 'dev', '1.4.0rc4.dev2'),
+    ('1.4.0rc3', 'major', 'dev', '2.0.0.dev1'),
+])
+def test_bump_pre_release(version, part, pre, expected):
+    assert bump_version(version, part, pre) == expected
+
+
+def test_bump_pre_release_backwards():
+    with pytest.raises(InvalidVersion):
+        bump_version('1.4.0rc3', 'patch', 'a')
+
+
+def test_bump_unknown_pre_release_channel():
+    with pytest.raises(ValueError):
+        bump_version('1.2.3', 'patch', 'gamma')
+
+
+def test_bump_unknown_version_part():
+    with pytest.raises(ValueError):
+        bump_version('1.2.3', 'build')
+
+
+def test_bump_version_keyword_arguments():
+    assert bump_version('1.4.0rc3', 'patch', pre='rc') == '1.4.0rc4'
+    assert bump_version(version='1.4.0rc3', part='patch') == '1.4.0'